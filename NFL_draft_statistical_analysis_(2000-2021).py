@@ -24,18 +24,18 @@
 
 import pandas as pd
 import numpy as np
+import numexpr as ne
 import statsmodels.api as sm
 import plotly.express as px
 import matplotlib.pyplot as plt
 import seaborn as sns
-import statsmodels.formula.api as smf
 plt.style.use('ggplot')
 
 
 # In[2]:
 
 
-df = pd.read_csv(r'C:\Users\Connor\OneDrive\Documents\Data Analysis\Datasets\nfl_draft_data\2000-2021 Draft Picks.csv')
+df = pd.read_csv(r'C:\Users\Connor\OneDrive\Documents\Data Analysis\Datasets\nfl_draft_data\2000-2021 Draft Picks.csv', engine='pyarrow', dtype_backend='pyarrow', usecols=['Year', 'Round', 'Overall', 'Team', 'Name', 'Position', 'School'])
 
 
 # In[3]:
@@ -73,15 +73,19 @@ df.info()
 # In[7]:
 
 
+# Store the repeated string columns as categories to speed up grouping and merging later
+for col in ['Name', 'School', 'Position', 'Team']:
+    df[col] = df[col].astype('category')
+
 # The Washington Football Team is now known as the Washington Commanders, therefore we should replace it to avoid confusion
-df = df.replace(to_replace = 'TEAM', value = 'COMMANDERS')
+df['Team'] = df['Team'].cat.rename_categories({'TEAM': 'COMMANDERS'})
 
 
 # In[8]:
 
 
 # Printing all positions selected in the years 2000-2021
-print(df['Position'].unique())
+print(df['Position'].cat.categories.tolist())
 
 
 # One important part of the cleaning process is to check for duplicates. Unfortunately, since many NFL players share the same name, we need to check if the same unique row appears once and only once. 
@@ -90,12 +94,12 @@ print(df['Position'].unique())
 
 
 # Check for exact duplicates
-duplicate_rows = df[df.duplicated()]
+dup_mask = df.duplicated()
 
 # Print the result
-if not duplicate_rows.empty:
+if dup_mask.any():
     print("Exact duplicates were found:")
-    print(duplicate_rows)
+    print(df[dup_mask])
 else:
     print("No exact duplicates were found.")
 
@@ -105,7 +109,13 @@ else:
 # In[10]:
 
 
-combine_df = pd.read_csv(r'C:\Users\Connor\OneDrive\Documents\Data Analysis\Datasets\nfl_draft_data\combine_stats_df.csv', index_col = 0)
+combine_cols = ['Player', 'School', 'draft_year', 'Ht', 'Wt', '40yd', 'Vertical', 'Bench', 'Broad Jump', '3Cone', 'Shuttle']
+combine_df = pd.read_csv(r'C:\Users\Connor\OneDrive\Documents\Data Analysis\Datasets\nfl_draft_data\combine_stats_df.csv', engine='pyarrow', dtype_backend='pyarrow', usecols=combine_cols)
+
+# Renaming several columns of our dataset to avoid errors in the regression later on
+combine_df = combine_df.rename(columns={'40yd': 'Forty_yd', 'Broad Jump': 'Broad_Jump', '3Cone': 'Cone_3'})
+for col in ['Player', 'School']:
+    combine_df[col] = combine_df[col].astype('category')
 combine_df.head(10)
 
 
@@ -121,21 +131,20 @@ combine_df.describe()
 print(combine_df.columns)
 
 
-# A few things immediately stand out to us which will make the cleaning process a bit more taxing. First, the school/university attended by the player is often not spelled the same way as it is in our original dataset (e.g., Boston Col. != Boston College). Second, and though we can remove it, is that the 'Pos' column has more positions than the original dataset, opting for depth over clarity. Lastly, some NaN values are several quantitative combine attributes such as Bench and Broad Jump; however, this is to be expected since not every position/player partakes in these events at the combine. Let's fix the school spelling issue first.
+# A few things immediately stand out to us which will make the cleaning process a bit more taxing. First, the school/university attended by the player is often not spelled the same way as it is in our original dataset (e.g., Boston Col. != Boston College). Second, the combine file's 'Pos' column has more positions than the original dataset, opting for depth over clarity, which is why we left it out when loading the data. Lastly, some NaN values are several quantitative combine attributes such as Bench and Broad Jump; however, this is to be expected since not every position/player partakes in these events at the combine. Let's fix the school spelling issue first.
 
 # In[13]:
 
 
-# Iterate over each row in df
-for index, row in df.iterrows():
-    # Find the corresponding row in combine_df based on player name, draft year, and overall pick
-    matching_row_index = (combine_df['Player'] == row['Name']) & (combine_df['draft_year'] == row['Year'])
-    matching_row = combine_df[matching_row_index]
-    
-    # If a matching row is found
-    if not matching_row.empty:
-        # Update the college in combine_df to match df
-        combine_df.loc[matching_row_index, 'School'] = row['School']
+# Build a lookup of the school names used in df, keyed on player name and draft year
+school_key = df[['Name', 'Year', 'School']].rename(columns={'Name': 'Player', 'Year': 'draft_year', 'School': 'School_auth'})
+# If two players share a name and draft year, the last one listed in df wins
+school_key = school_key.drop_duplicates(subset=['Player', 'draft_year'], keep='last')
+
+# Join the lookup onto combine_df and update the college wherever a match is found
+combine_df = combine_df.merge(school_key, on=['Player', 'draft_year'], how='left')
+combine_df['School'] = combine_df['School_auth'].combine_first(combine_df['School'])
+combine_df.drop(columns=['School_auth'], inplace=True)
 
 # verify that schools like  Boston Col. are now Boston College
 combine_df.head()
@@ -146,8 +155,20 @@ combine_df.head()
 # In[14]:
 
 
-# Merge the datasets based on 'Name', 'School', and 'draft_year'
-merged_data = pd.merge(df, combine_df, how='left', left_on=['Name', 'School', 'Year'], right_on=['Player', 'School', 'draft_year'])
+# Match the key column names of df
+combine_df = combine_df.rename(columns={'Player': 'Name', 'draft_year': 'Year'})
+
+# Players sharing the same name, school, and draft year would otherwise be matched more than once
+combine_df = combine_df.drop_duplicates(subset=['Name', 'School', 'Year'], keep='first')
+
+# Encode the string keys as categories shared by both datasets
+for key in ['Name', 'School']:
+    key_dtype = pd.CategoricalDtype(pd.concat([df[key], combine_df[key]]).dropna().unique())
+    df[key] = df[key].astype(key_dtype)
+    combine_df[key] = combine_df[key].astype(key_dtype)
+
+# Merge the datasets based on 'Name', 'School', and 'Year'
+merged_data = df.merge(combine_df, on=['Name', 'School', 'Year'], how='left', validate='m:1')
 
 # Print the merged dataset
 merged_data.head()
@@ -159,44 +180,37 @@ merged_data.head()
 merged_data.describe()
 
 
-# The count tells us that there are 5,616 observations in the merged dataset, which cannot be right. This is likely due to duplicates being made due to players sharing the same name and year drafted. Let's check this below.
+# The count tells us that there are 5,609 observations in the merged dataset, one for each player drafted. Since many players share the same name and year drafted, we removed the duplicate combine entries before merging so that no player is matched more than once. Let's check this below.
 
 # In[16]:
 
 
-duplicate_rows = merged_data[merged_data.duplicated(subset=['Name', 'School', 'Year'], keep=False)]
-print(duplicate_rows)
+dup_mask = merged_data.duplicated(subset=['Name', 'School', 'Year'], keep=False)
 
+if dup_mask.any():
+    print(merged_data[dup_mask])
+else:
+    print("No duplicate players were found.")
 
-# In[17]:
 
+# In[17]:
 
-# Drop redundant columns
-merged_data.drop(['Pos', 'draft_year', 'Player'], axis=1, inplace=True)
 
-merged_data.drop_duplicates(subset=['Name', 'School', 'Year'], keep='first', inplace=True)
 merged_data.describe()
 
 
-# From above, we see that height is not being displayed in the descriptive statistics. Further exploration of the .csv file reveals that the height column displays data by inches added to a month of the year for feet (e.g., May and June representing 5 feet and 6 feet, respectively). Fortunately, we can rectify this with a simple conversion function. Converting the height to total inches will allow for easier calculation and analysis later.
+# From above, we see that height is not being displayed in the descriptive statistics. Further exploration of the .csv file reveals that the height column displays data by inches added to a month of the year for feet (e.g., May and June representing 5 feet and 6 feet, respectively). Fortunately, we can rectify this by splitting the column into feet and inches. Converting the height to total inches will allow for easier calculation and analysis later.
 
 # In[18]:
 
 
-def convert_height_inches(height):
-    try:
-        # Extract feet and inches from the height
-        feet, inches = map(int, height.split('-'))
-        
-        # Convert feet to inches and sum with inches
-        total_inches = feet * 12 + inches
-        
-        return total_inches
-    except:
-        return None
+# Split the height into its feet and inches components (e.g., '6-4' -> 6 and 4)
+height_parts = merged_data['Ht'].str.split('-', n=1, expand=True)
+feet = pd.to_numeric(height_parts[0], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+inches = pd.to_numeric(height_parts[1], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
 
-# Applying the function to the 'Ht' column
-merged_data['Ht'] = merged_data['Ht'].apply(convert_height_inches)
+# Convert feet to inches and sum with inches in a single pass
+merged_data['Ht'] = ne.evaluate('feet * 12 + inches')
 
 
 # In[19]:
@@ -220,11 +234,16 @@ merged_data.describe()
 # In[21]:
 
 
-overall_position_means = merged_data.groupby('Position')['Overall'].mean()
+# Average pick and number of picks for every round and position in a single pass
+position_round_stats = merged_data.groupby(['Round', 'Position'], observed=True)['Overall'].agg(['mean', 'size']).reset_index()
+
+# Weight each round's average by its number of picks to recover the overall average by position
+position_totals = position_round_stats.assign(total=position_round_stats['mean'] * position_round_stats['size']).groupby('Position', observed=True)[['total', 'size']].sum()
+overall_position_means = (position_totals['total'] / position_totals['size']).rename('Overall')
 print(overall_position_means)
 
 # Visualizing
-plt.bar(overall_position_means.index, overall_position_means, color ='skyblue')
+overall_position_means.plot.bar(color='skyblue')
 plt.title('Average NFL Draft Pick by Position (2000-2021) ')
 plt.xlabel('Position')
 plt.ylabel('Average Overall Pick')
@@ -240,12 +259,12 @@ plt.show()
 # In[22]:
 
 
-first_round_data = merged_data[merged_data['Round'] == 1]
-rd1_overall_position_means = first_round_data.groupby('Position')['Overall'].mean().reset_index()
+rd1_position_stats = position_round_stats[position_round_stats['Round'] == 1]
+rd1_overall_position_means = rd1_position_stats.set_index('Position')['mean'].rename('Overall')
 print(rd1_overall_position_means)
 
 # Visualizing 
-plt.bar(rd1_overall_position_means['Position'], rd1_overall_position_means['Overall'], color ='skyblue')
+rd1_overall_position_means.plot.bar(color='skyblue')
 plt.title('Average NFL Draft Pick by Position in the 1st Round (2000-2021) ')
 plt.xlabel('Position')
 plt.ylabel('Average Overall Pick in the 1st Round')
@@ -260,10 +279,9 @@ plt.show()
 
 
 # Calculate the frequency of positions drafted in the first round 
-position_counts = first_round_data['Position'].value_counts().reset_index()
-position_counts.columns = ['position', 'count']
+position_counts = rd1_position_stats.set_index('Position')['size'].sort_values(ascending=False, kind='stable').rename('count')
 
-plt.bar(position_counts['position'], position_counts['count'], color = 'orange', label = 'frequency')
+position_counts.plot.bar(color='orange', label='frequency', rot=0)
 plt.title('Distribution of Picks in the First Round by Position (2000-2021)')
 plt.xlabel('Position')
 plt.ylabel('Frequency (Count)')
@@ -278,7 +296,8 @@ position_counts
 # In[24]:
 
 
-overall_position_means_yearly = merged_data.groupby(['Year', 'Position'])['Overall'].mean()
+# Average overall pick by year, with one column per position
+overall_position_means_yearly = merged_data.pivot_table(index='Year', columns='Position', values='Overall', aggfunc='mean', observed=True)
 
 
 # In[25]:
@@ -286,14 +305,11 @@ overall_position_means_yearly = merged_data.groupby(['Year', 'Position'])['Overa
 
 from matplotlib.ticker import FuncFormatter
 
-# Unstack the multi-index series to pivot the 'Position' index into columns
-overall_position_means_yearly_unstacked = overall_position_means_yearly.unstack()
-
 # Unique colors for each position
-color_palette = sns.color_palette("husl", len(overall_position_means_yearly_unstacked.columns))
+color_palette = sns.color_palette("husl", len(overall_position_means_yearly.columns))
 
 # Plot the time series with unique colors
-ax = overall_position_means_yearly_unstacked.plot(figsize=(10, 6), color=color_palette)
+ax = overall_position_means_yearly.plot(figsize=(10, 6), color=color_palette)
 plt.xlabel('Year')
 plt.ylabel('Average Overall Draft Position')
 plt.title('Average Overall Draft Position by Position and Year')
@@ -301,7 +317,7 @@ plt.legend(title='Position', bbox_to_anchor=(1.05, 1), loc='upper left')
 plt.grid(True)
 
 # Start from the left edge
-ax.set_xlim(overall_position_means_yearly_unstacked.index[0], overall_position_means_yearly_unstacked.index[-1])
+ax.set_xlim(overall_position_means_yearly.index[0], overall_position_means_yearly.index[-1])
 
 # Remove decimals
 def format_func(value, tick_number):
@@ -324,17 +340,17 @@ plt.show()
 # In[26]:
 
 
-# Renaming several columns of our dataset to avoid errors
-merged_data.rename(columns={'40yd': 'Forty_yd'}, inplace=True)
-
-merged_data.rename(columns={'Broad Jump': 'Broad_Jump'}, inplace=True)
+num_cols = ['Ht', 'Wt', 'Forty_yd', 'Vertical', 'Bench', 'Broad_Jump', 'Cone_3', 'Shuttle']
 
-merged_data.rename(columns={'3Cone': 'Cone_3'}, inplace=True)
+# Convert the combine results to a single numeric matrix once, so every model below can reuse it
+X_full = merged_data[num_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+y_full = merged_data['Overall'].to_numpy(dtype=np.float32)
 
-formula = 'Overall ~ Ht + Wt + Forty_yd + Vertical + Bench + Broad_Jump + Cone_3 + Shuttle'
+# Only use players with complete combine results
+valid = ~np.isnan(X_full).any(axis=1)
 
-model = smf.ols(formula=formula, data=merged_data).fit()
-print(model.summary())
+model = sm.OLS(y_full[valid], sm.add_constant(X_full[valid])).fit()
+print(model.summary(yname='Overall', xname=['Intercept'] + num_cols))
 
 
 # We can derive some key insights from the regression results above. 
@@ -350,15 +366,16 @@ print(model.summary())
 
 
 # Subset the data to include only quarterbacks
-qb_data = merged_data[merged_data['Position'] == 'QB']
+qb_mask = (merged_data['Position'] == 'QB').to_numpy()
 
 # Many Quarterbacks do not run the same speed/conditioning drills as other positions
-formula_qb = 'Overall ~ Ht'
-
+cols_qb = ['Ht']
+X_qb = X_full[:, [num_cols.index(col) for col in cols_qb]]
+valid_qb = qb_mask & ~np.isnan(X_qb).any(axis=1)
 
-model_qb = smf.ols(formula=formula_qb, data=qb_data).fit()
+model_qb = sm.OLS(y_full[valid_qb], sm.add_constant(X_qb[valid_qb])).fit()
 
-print(model_qb.summary())
+print(model_qb.summary(yname='Overall', xname=['Intercept'] + cols_qb))
 
 
 # In the above model, we utilize a simple linear regression to regress overall selection on Height for Quarterbacks only. So, as a Quarterback's height increases by one unit, their estimated overall draft selection decreases (they are selected earlier in the draft) by approximately -7.05. Additionally, Height is significant at the 5% significance level. This result is far different than the OLS result we obtained earlier, and should highlight how important it is to investigate the results first. 
@@ -368,45 +385,38 @@ print(model_qb.summary())
 # In[327]:
 
 
-# Get the top 20 schools based on counts
-top_20_schools = merged_data['School'].value_counts().head(20).index
+# Mark the first round picks as a plain array so it can be reused without index alignment
+r1_mask = merged_data['Round'].to_numpy() == 1
 
-# Count the instances of each school in the overall draft and first round
-school_draft_counts = {}
-school_first_round_counts = {}
+# Count the overall and first round selections for every school in a single pass
+school_counts = (
+    merged_data.assign(is_r1=r1_mask.astype('int32'))
+    .groupby('School', observed=True, sort=False)
+    .agg(overall=('School', 'size'), r1=('is_r1', 'sum'))
+)
 
-for school in top_20_schools:
-    # Count instances in overall draft
-    overall_count = len(merged_data[merged_data['School'] == school])
-    school_draft_counts[school] = overall_count
-    
-    # Count instances in first round
-    first_round_count = len(merged_data[(merged_data['School'] == school) & (merged_data['Round'] == 1)])
-    school_first_round_counts[school] = first_round_count
+# Get the top 20 schools based on overall counts
+top_20_schools = school_counts.nlargest(20, 'overall')
 
 print("Counts of selections for top 20 schools:")
 print()
-for school, draft_count in school_draft_counts.items():
-    print(f"{school}: Overall Draft Selections: {draft_count}, First Round Selections: {school_first_round_counts[school]}")
+for school, counts in top_20_schools.iterrows():
+    print(f"{school}: Overall Draft Selections: {counts['overall']}, First Round Selections: {counts['r1']}")
 
 
 # In[328]:
 
 
-schools = list(school_draft_counts.keys())
-overall_counts = list(school_draft_counts.values())
-first_round_counts = list(school_first_round_counts.values())
-
 plt.figure(figsize=(10, 6))
-plt.scatter(overall_counts, first_round_counts, color='red')
+plt.scatter(top_20_schools['overall'], top_20_schools['r1'], color='red')
 
 plt.xlabel('Overall Draft Selections')
 plt.ylabel('First Round Selections')
 plt.title('Overall vs First Round Selections for Top 20 Schools')
 
 # Add school names as annotations
-for i, school in enumerate(schools):
-    plt.annotate(school, (overall_counts[i], first_round_counts[i]))
+for school, counts in top_20_schools.iterrows():
+    plt.annotate(school, (counts['overall'], counts['r1']))
 
 # Show plot
 plt.grid(True)
@@ -427,38 +437,30 @@ plt.show()
 successful_qb_teams = ['PATRIOTS', 'SAINTS', 'STEELERS']
 poor_qb_teams = ['BEARS', 'BROWNS', 'JAGUARS']
 
-# Create separate DataFrames for each group
-good_qb = merged_data[merged_data['Team'].isin(successful_qb_teams)]
-bad_qb = merged_data[merged_data['Team'].isin(poor_qb_teams)]
+# Tag each pick with its team's group, dropping teams in neither group
+bucket_map = {team: 'good' for team in successful_qb_teams} | {team: 'bad' for team in poor_qb_teams}
+tagged = merged_data.assign(bucket=merged_data['Team'].map(bucket_map)).dropna(subset=['bucket'])
 
+# Occurrences of each position for both groups, sorted by the successful QB teams' counts
+qb_team_positions = tagged.groupby(['bucket', 'Position'], observed=True).size().unstack('bucket', fill_value=0)
+qb_team_positions = qb_team_positions.sort_values('good', ascending=False)
 
-# In[330]:
 
+# In[330]:
 
-# Occurrences of each position for the successful QB teams
-good_qb_team_positions = good_qb['Position'].value_counts()
-
-# Occurrences of each position for the poor QB teams
-bad_qb_team_positions = bad_qb['Position'].value_counts()
 
 print("Positions drafted by successful QB teams:")
-print(good_qb_team_positions)
+print(qb_team_positions['good'])
 print("\nPositions drafted by poor QB teams:")
-print(bad_qb_team_positions)
+print(qb_team_positions['bad'].sort_values(ascending=False))
 
 
 # In[331]:
 
 
-# Sort positions by overall counts for successful QB teams
-good_qb_sorted = good_qb_team_positions.sort_values(ascending=False)
-
-# Sort positions by overall counts for poor QB teams
-bad_qb_sorted = bad_qb_team_positions.sort_values(ascending=False)
-
 plt.figure(figsize=(10, 6))
-plt.bar(good_qb_sorted.index, good_qb_sorted, color='blue', alpha = 0.7, label='Successful QB Teams')
-plt.bar(bad_qb_sorted.index, bad_qb_sorted, color='red', alpha = 0.7, label='Poor QB Teams')
+qb_team_positions['good'].plot.bar(color='blue', alpha=0.7, label='Successful QB Teams')
+qb_team_positions['bad'].plot.bar(color='red', alpha=0.7, label='Poor QB Teams')
 plt.xlabel('Position')
 plt.ylabel('Count')
 plt.title('Comparison of Drafted Positions by QB Team Performance (Sorted)')